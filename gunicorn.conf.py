@@ -0,0 +1,17 @@
+# Gunicorn settings (loaded by `gunicorn -c gunicorn.conf.py app:app`)
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+
+# One process keeps the quote/TTS caches, market data and history writer shared;
+# the work is I/O bound (Yahoo, Groq, ElevenLabs), so concurrency comes from threads.
+# Streams (/api/stream, /chat, /tts) each hold a thread for their lifetime.
+worker_class = 'gthread'
+workers = int(os.environ.get('WEB_CONCURRENCY', 1))
+threads = int(os.environ.get('GUNICORN_THREADS', 32))
+
+# With gthread this is the worker heartbeat (a worker silent this long is restarted),
+# not a per-request limit: long streams like /chat and the 15-minute /api/stream are
+# unaffected by it, so don't tune this to fix stream cutoffs
+timeout = 120
+keepalive = 5
@@ -1,5 +1,5 @@
 // Sully AI Service Worker - PWA Offline Support
-const CACHE_NAME = 'sully-ai-v1';
+const CACHE_NAME = 'sully-ai-v2';  // Bumped to purge API/TTS responses cached by v1
 const OFFLINE_URL = '/offline.html';
 
 // Files to cache for offline use
@@ -10,6 +10,22 @@ const STATIC_CACHE = [
     'https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js'
 ];
 
+// Same-origin app shell paths worth keeping offline (plus navigations and /static/)
+const SHELL_PATHS = new Set([
+    '/',
+    '/manifest.json',
+    '/offline.html',
+    '/sully21-logo.png',
+    '/favicon.ico',
+    '/apple-touch-icon.png',
+    '/icon-192.png',
+    '/icon-512.png'
+]);
+
+function isShellRequest(request, url) {
+    return request.mode === 'navigate' || SHELL_PATHS.has(url.pathname) || url.pathname.startsWith('/static/');
+}
+
 // Install service worker and cache static assets
 self.addEventListener('install', event => {
     console.log('[ServiceWorker] Installing...');
@@ -39,6 +55,11 @@ self.addEventListener('activate', event => {
                     }
                 })
             );
+        }).then(() => {
+            // Start navigation requests in parallel with service worker boot
+            if (self.registration.navigationPreload) {
+                return self.registration.navigationPreload.enable();
+            }
         }).then(() => {
             console.log('[ServiceWorker] Claiming clients');
             return self.clients.claim();
@@ -58,14 +79,24 @@ self.addEventListener('fetch', event => {
         return;
     }
 
+    // Live data goes straight to the network: replaying a cached /api/stream transcript or
+    // stale /api/* JSON would show old prices as live, and /tts audio is unbounded
+    const url = new URL(event.request.url);
+    if (url.pathname.startsWith('/api/') || url.pathname === '/tts') {
+        return;
+    }
+    const cacheable = isShellRequest(event.request, url);
+
+    // Navigations reuse the preloaded response when navigation preload is enabled
+    const network = Promise.resolve(event.preloadResponse)
+        .then(preloaded => preloaded || fetch(event.request));
+
     event.respondWith(
-        fetch(event.request)
+        network
             .then(response => {
-                // Clone the response before caching
-                const responseToCache = response.clone();
-
-                // Cache successful responses
-                if (response.status === 200) {
+                // Cache successful app shell and static responses (clone before caching)
+                if (cacheable && response.status === 200) {
+                    const responseToCache = response.clone();
                     caches.open(CACHE_NAME).then(cache => {
                         cache.put(event.request, responseToCache);
                     });
@@ -0,0 +1,52 @@
+// Sully AI - Daily Owner Motivation System (sports focused)
+// Served from /static with a versioned URL so it stays in the browser cache.
+const dailyQuotes = [
+    // Game Day Mentality
+    { icon: "🏈", greeting: "Fourth Quarter", quote: "Winners are made in the fourth quarter. Time to execute." },
+    { icon: "⚾", greeting: "At Bat", quote: "Step up to the plate. Control what you can control. Win your at-bats." },
+    { icon: "🏀", greeting: "Clutch Time", quote: "Great players demand the ball in crunch time. Make your shots count." },
+    { icon: "🥊", greeting: "Round by Round", quote: "Boxing is won round by round. So is business. Win today." },
+    { icon: "🏁", greeting: "Race Mode", quote: "The race is long. Stay focused on your lane. Finish first." },
+
+    // Competition & Performance
+    { icon: "🎯", greeting: "Lock In", quote: "Distractions lose games. Lock in on what matters. Execute." },
+    { icon: "💪", greeting: "Training Day", quote: "Champions train when others rest. You show up. That's the difference." },
+    { icon: "🔥", greeting: "Heat Check", quote: "Momentum is real. RoofER has it. Keep pushing the advantage." },
+    { icon: "⚡", greeting: "Fast Break", quote: "Speed kills in sports and business. Move faster than the competition." },
+    { icon: "🏆", greeting: "Championship DNA", quote: "Championships are won in preparation. You put in the work." },
+
+    // Strategy & Execution
+    { icon: "♟️", greeting: "Next Move", quote: "Think three moves ahead. Your strategy separates you from the pack." },
+    { icon: "📊", greeting: "Film Study", quote: "Winners study the game. Your data is your film. Use it." },
+    { icon: "🎲", greeting: "Calculated Play", quote: "Smart risks win games. Stupid risks lose seasons. Know the difference." },
+    { icon: "🧭", greeting: "Game Plan", quote: "Stick to the game plan. Adjust when needed. Never panic." },
+    { icon: "⚙️", greeting: "System Check", quote: "Champions build systems. Your infrastructure wins games for you." },
+
+    // Team & Leadership
+    { icon: "🤝", greeting: "Team First", quote: "Great teams trust each other. RoofER Family backs you up." },
+    { icon: "🛡️", greeting: "Got Your Back", quote: "Your team protects you. You protect them. That's how dynasties work." },
+    { icon: "📣", greeting: "Captain Mode", quote: "Lead from the front. Your team follows your energy." },
+    { icon: "🌊", greeting: "Rising Tide", quote: "Lift your team up. Winning teams win together." },
+    { icon: "💼", greeting: "Owner Mentality", quote: "You own this. Act like it. That mindset changes everything." },
+
+    // Market & Money
+    { icon: "💹", greeting: "Market Watch", quote: "Bulls make money. Bears make money. Pigs get slaughtered. Stay sharp." },
+    { icon: "📈", greeting: "Upside Play", quote: "Your portfolio reflects your conviction. Back your winners." },
+    { icon: "💰", greeting: "Capital Moves", quote: "Money follows performance. Perform and the money comes." },
+    { icon: "⏰", greeting: "Prime Time", quote: "Your time is your most valuable asset. Invest it wisely." },
+    { icon: "🎖️", greeting: "Earned Respect", quote: "Respect is earned through results. You earn yours daily." },
+
+    // Intensity & Focus
+    { icon: "🔨", greeting: "Grind Mode", quote: "Building something real takes relentless effort. Keep hammering." },
+    { icon: "🎾", greeting: "Point by Point", quote: "Win the point in front of you. Championships follow." },
+    { icon: "🏋️", greeting: "Weight Room", quote: "Strength compounds daily. So does your business." },
+    { icon: "🚀", greeting: "Launch Ready", quote: "RoofER is positioned to dominate. Time to take off." },
+    { icon: "⚔️", greeting: "Battle Ready", quote: "Competition never sleeps. Neither should your edge." },
+
+    // Execution & Results
+    { icon: "✅", greeting: "Execute", quote: "Plans are worthless without execution. Make it happen today." },
+    { icon: "🌅", greeting: "Day One", quote: "Every morning is game day. Come ready to compete." },
+    { icon: "📱", greeting: "Live Feed", quote: "Real-time data. Real-time decisions. That's your advantage." },
+    { icon: "🧠", greeting: "Mental Edge", quote: "The mental game separates good from great. Stay focused." },
+    { icon: "🎪", greeting: "Show Time", quote: "This is your stage. Perform like you own it. Because you do." }
+];
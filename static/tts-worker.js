@@ -0,0 +1,19 @@
+// Sully AI - Server TTS worker
+// Fetches /tts audio off the UI thread and hands the bytes back as a transferable
+// ArrayBuffer; the page decodes and plays them through an AudioContext.
+
+self.onmessage = async (event) => {
+    const { id, text } = event.data;
+
+    try {
+        const response = await fetch('/tts?text=' + encodeURIComponent(text));
+        if (!response.ok) {
+            throw new Error(`TTS request failed: ${response.status}`);
+        }
+
+        const audio = await response.arrayBuffer();
+        self.postMessage({ id, audio }, [audio]);
+    } catch (error) {
+        self.postMessage({ id, error: String(error) });
+    }
+};